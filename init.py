@@ -23,7 +23,8 @@ def _bootstrap_from_root() -> None:
     src_dir = os.path.join(root, "src")
 
     if os.path.isdir(src_dir):
-        # Triggers src/init.py so plugin resources are registered.
+        # Triggers src/init.py (and src/menu.py in UI sessions) so plugin
+        # resources and the toolbar entry are registered.
         nuke.pluginAddPath(src_dir)
 
 
@@ -7,8 +7,11 @@ wrapped in top-level try/except so that a callback failure never crashes Nuke.
 from __future__ import annotations
 
 from datetime import datetime
+from html import escape as _html_escape
 import json
 import os
+import re
+from pathlib import Path
 from typing import Optional
 
 import nuke
@@ -39,6 +42,9 @@ _PARAM_LINKS = (
     ("debug_mode", "debug_mode", "debug_mode", None),
 )
 
+# Every internal var name; returned as the "all missing" list on error paths.
+_ALL_INTERNAL_NAMES = tuple(internal_name for _, _, internal_name, _ in _PARAM_LINKS)
+
 # Knobs that actually require a re-sync when changed.  All others (slider
 # drags on linked params, UI cosmetic knobs) are ignored by knobChanged to
 # avoid expensive re-entrancy and unnecessary Blink recompiles.
@@ -47,7 +53,7 @@ _KNOBS_NEEDING_SYNC = frozenset({
     "hue_curve_data",
     "input_colorspace",
     "output_colorspace",
-    "showPanel",         # panel open — triggers updateValue on PyCustom widgets
+    "showPanel",         # panel open — PyCustom updateValue + first-open colorspace defaults
 })
 
 # Lightweight knobs update runtime LUT state only (no compile/reload path).
@@ -66,6 +72,8 @@ except Exception:
 # cascades that can crash Nuke.
 _in_callback = False
 
+# callbacks.py lives in .../gizmos; resolved once since __file__ never moves.
+_MODULE_DIR = os.path.abspath(os.path.dirname(__file__))
 _KERNEL_SOURCE_RELATIVE = os.path.join("blink", "oklch_grade_kernel.cpp")
 _DEBUG_ENV = "OKLCH_GRADE_DEBUG"
 _DEBUG_LOG_ENV = "OKLCH_GRADE_DEBUG_LOG"
@@ -211,7 +219,9 @@ def _nuke_major_version() -> int:
         return 0
 
 
-_debug(f"module_loaded nuke_major={_nuke_major_version()}", node=None)
+_NUKE_MAJOR = _nuke_major_version()
+
+_debug(f"module_loaded nuke_major={_NUKE_MAJOR}", node=None)
 
 
 def _knob(node: Optional[nuke.Node], name: str):
@@ -223,6 +233,41 @@ def _knob(node: Optional[nuke.Node], name: str):
         return None
 
 
+# Status panel messages.  Fixed messages are complete strings; *_FMT templates
+# take str.format() fields.
+# Error statuses are red; searched case-insensitively without lowering a copy.
+_ERR_COLOR_RE = re.compile(r"#cc6666", re.IGNORECASE)
+_STATUS_KERNEL_NOT_FOUND = (
+    "<font color='#cc6666'><small><b>Status:</b> "
+    "Kernel file not found. Expected oklch_grade_kernel.cpp in the install tree."
+    "</small></font>"
+)
+_STATUS_BLINK_NOT_READY = (
+    "<font color='#cc6666'><small><b>Status:</b> BlinkScript node not ready yet.</small></font>"
+)
+_STATUS_PARAMS_MISSING_FMT = (
+    "<font color='#cc6666'><small><b>Status:</b> Blink kernel params missing after compile: "
+    "{names}{more}.</small></font>"
+)
+_STATUS_UNRESOLVED_FMT = (
+    "<font color='#cc6666'><small><b>Status:</b> "
+    "{count} linked controls are unresolved. Open BlinkScript node and click Recompile."
+    "</small></font>"
+)
+_STATUS_HUE_CURVES_DISABLED = (
+    "<font color='#cc9966'><small><b>Status:</b> "
+    "Hue Curves disabled: missing internal LUT helper nodes in this instance."
+    "</small></font>"
+)
+_STATUS_WORKING_SPACE_OK_FMT = (
+    "<font color='#66AA66'><small><b>Status:</b> OK (working space: {space})</small></font>"
+)
+_STATUS_NO_LINEAR_ALIAS = (
+    "<font color='#777777'><small><b>Status:</b> Note: no linear-sRGB alias found. "
+    "Falling back to scene_linear.</small></font>"
+)
+
+
 def _set_status(node: Optional[nuke.Node], html: str) -> None:
     status = _knob(node, "status_text")
     if status is None:
@@ -234,7 +279,7 @@ def _set_status(node: Optional[nuke.Node], html: str) -> None:
 
 
 def _escape_html(text: str) -> str:
-    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return _html_escape(text, quote=False)
 
 
 def _status_value(node: Optional[nuke.Node]) -> str:
@@ -247,19 +292,91 @@ def _status_value(node: Optional[nuke.Node]) -> str:
         return ""
 
 
-def _resolve_blink_knob_name(blink: nuke.Node, label: str, internal_name: str) -> Optional[str]:
+# Resolved Blink knob names per Blink node: {blink.fullName(): {internal_name: knob_name}}.
+# Cleared for a node whenever its kernel is reloaded or recompiled, since the
+# param knob set may change.
+_RESOLVE_CACHE: dict[str, dict[str, str]] = {}
+
+# Last clean _sync_links pass per Blink node: {blink.fullName(): (kernel path, mtime_ns)}.
+# A matching token means kernel state and ranges are in place; links are still
+# verified on every pass.
+_SYNC_TOKENS: dict[str, tuple[str, int]] = {}
+
+# Blink nodes (by fullName) whose public and Blink param ranges are already
+# set.  Ranges are constant, so setRange only needs to run again after a
+# recompile/reload recreates the param knobs.
+_RANGES_SET: set[str] = set()
+
+
+def _resolve_cache_for(blink: Optional[nuke.Node]) -> dict[str, str]:
+    return _RESOLVE_CACHE.setdefault(_node_name(blink), {})
+
+
+def _invalidate_blink_caches(blink: Optional[nuke.Node]) -> None:
+    name = _node_name(blink)
+    _RESOLVE_CACHE.pop(name, None)
+    _SYNC_TOKENS.pop(name, None)
+    _RANGES_SET.discard(name)
+
+
+def _blink_candidates(label: str, internal_name: str) -> tuple[str, str, str]:
     # Handle both Blink naming styles seen in the wild:
     # 1) Internal var name: l_gain
     # 2) Label-derived: OKLCHGrade_L Gain / OKLCHGrade_L_Gain
-    candidates = (
+    return (
         internal_name,
         f"OKLCHGrade_{label}",
         f"OKLCHGrade_{label.replace(' ', '_')}",
     )
+
+
+# _PARAM_LINKS flattened once at import for the sync loop:
+# (public knob name, internal var name, Blink knob candidates, lo, hi, has_range)
+_PARAM_LINKS_FLAT = tuple(
+    (
+        public_name,
+        internal_name,
+        _blink_candidates(label, internal_name),
+        value_range[0] if value_range else 0.0,
+        value_range[1] if value_range else 0.0,
+        value_range is not None,
+    )
+    for public_name, label, internal_name, value_range in _PARAM_LINKS
+)
+
+# Candidate names by internal var name, including Blink params that have no
+# public knob but are written from Python (hue LUT state).
+_BLINK_CANDIDATES: dict[str, tuple[str, ...]] = {
+    internal_name: candidates for _, internal_name, candidates, _, _, _ in _PARAM_LINKS_FLAT
+}
+for _name in ("hue_lut_width", "hue_lut_connected"):
+    _BLINK_CANDIDATES[_name] = _blink_candidates(_name, _name)
+del _name
+
+
+def _resolve_blink_knob_name(
+    blink_knobs: dict,
+    internal_name: str,
+    candidates: tuple[str, ...],
+    cache: Optional[dict[str, str]] = None,
+) -> tuple[Optional[str], object]:
+    """Pick the Blink knob for a param from a single ``blink.knobs()`` snapshot.
+
+    Returns ``(knob_name, knob)``, or ``(None, None)`` when no candidate exists.
+    """
+    if cache is not None:
+        cached = cache.get(internal_name)
+        if cached is not None:
+            knob = blink_knobs.get(cached)
+            if knob is not None:
+                return cached, knob
     for candidate in candidates:
-        if _knob(blink, candidate) is not None:
-            return candidate
-    return None
+        knob = blink_knobs.get(candidate)
+        if knob is not None:
+            if cache is not None:
+                cache[internal_name] = candidate
+            return candidate, knob
+    return None, None
 
 
 def _set_blink_param_if_exists(
@@ -267,15 +384,29 @@ def _set_blink_param_if_exists(
     internal_name: str,
     label: str,
     value,
+    blink_knobs: Optional[dict] = None,
 ) -> bool:
+    """Set a Blink param by name; pass ``blink_knobs`` to reuse a snapshot."""
     if blink is None:
         return False
-    resolved = _resolve_blink_knob_name(blink, label, internal_name)
-    if not resolved:
-        return False
-    knob = _knob(blink, resolved)
+    if blink_knobs is None:
+        blink_knobs = blink.knobs()
+    candidates = _BLINK_CANDIDATES.get(internal_name) or _blink_candidates(label, internal_name)
+    _, knob = _resolve_blink_knob_name(
+        blink_knobs,
+        internal_name,
+        candidates,
+        _resolve_cache_for(blink),
+    )
     if knob is None:
         return False
+    try:
+        # Skip no-op writes: every setValue marks the script modified and
+        # can trigger a Blink re-render.
+        if knob.value() == value:
+            return True
+    except Exception:
+        pass
     try:
         knob.setValue(value)
         return True
@@ -283,13 +414,22 @@ def _set_blink_param_if_exists(
         return False
 
 
-def _missing_param_knobs(blink: Optional[nuke.Node]) -> list[str]:
+def _collect_missing_params(blink: Optional[nuke.Node], limit: int = 7) -> list[str]:
+    """Return up to ``limit`` missing Blink params.
+
+    Callers only test truthiness and show the first six names plus "...",
+    so scanning stops once ``limit`` misses are found.
+    """
     if blink is None:
-        return [internal_name for _, _, internal_name, _ in _PARAM_LINKS]
+        return list(_ALL_INTERNAL_NAMES[:limit])
+    blink_knobs = blink.knobs()
+    cache = _resolve_cache_for(blink)
     missing: list[str] = []
-    for _, label, internal_name, _ in _PARAM_LINKS:
-        if _resolve_blink_knob_name(blink, label, internal_name) is None:
+    for _, internal_name, candidates, _, _, _ in _PARAM_LINKS_FLAT:
+        if _resolve_blink_knob_name(blink_knobs, internal_name, candidates, cache)[0] is None:
             missing.append(internal_name)
+            if len(missing) >= limit:
+                break
     return missing
 
 
@@ -297,6 +437,7 @@ def _run_recompile(blink: Optional[nuke.Node]) -> None:
     recompile = _knob(blink, "recompile")
     if recompile is None:
         return
+    _invalidate_blink_caches(blink)
     try:
         recompile.execute()
         _debug("blink.recompile executed", node=blink)
@@ -306,8 +447,32 @@ def _run_recompile(blink: Optional[nuke.Node]) -> None:
         pass
 
 
+# {kernel path: (st_mtime_ns, st_size, source)}; one stat validates a hit.
+_KERNEL_SOURCE_CACHE: dict[str, tuple[int, int, str]] = {}
+
+
+def _read_kernel_source(path: str) -> Optional[str]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    cached = _KERNEL_SOURCE_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        # Normalise CRLF (autocrlf checkouts) as text-mode reads used to.
+        source = Path(path).read_bytes().decode("utf-8").replace("\r\n", "\n")
+    except Exception:
+        return None
+    _KERNEL_SOURCE_CACHE[path] = (st.st_mtime_ns, st.st_size, source)
+    return source
+
+
 def _set_kernel_source_inline_from_file(blink: Optional[nuke.Node]) -> bool:
-    """Fallback for older Blink builds where file-mode may not materialize params."""
+    """Fallback for older Blink builds where file-mode may not materialize params.
+
+    Returns True only when kernelSource was actually rewritten.
+    """
     if blink is None:
         return False
     kernel_source = _knob(blink, "kernelSource")
@@ -316,11 +481,16 @@ def _set_kernel_source_inline_from_file(blink: Optional[nuke.Node]) -> bool:
     kernel_path = _find_kernel_absolute_path()
     if not kernel_path:
         return False
+    source = _read_kernel_source(kernel_path)
+    if source is None:
+        return False
     try:
-        with open(kernel_path, "r", encoding="utf-8") as handle:
-            source = handle.read()
+        # Reopened scripts already carry the inline source; rewriting it
+        # would only dirty the node and force a recompile.
+        if kernel_source.value() == source:
+            return False
     except Exception:
-        return False
+        pass
     try:
         kernel_source.setValue(source)
         return True
@@ -332,6 +502,7 @@ def _run_reload_kernel_source_file(blink: Optional[nuke.Node]) -> None:
     reload_knob = _knob(blink, "reloadKernelSourceFile")
     if reload_knob is None:
         return
+    _invalidate_blink_caches(blink)
     try:
         reload_knob.execute()
         _debug("blink.reloadKernelSourceFile executed", node=blink)
@@ -341,28 +512,49 @@ def _run_reload_kernel_source_file(blink: Optional[nuke.Node]) -> None:
 
 
 _kernel_path_cache: Optional[str] = None
-_kernel_path_cache_override: str = ""
+# OKLCH_GRADE_KERNEL_PATH is exported before Nuke starts: read at import and
+# re-read only when the cache is invalidated, not on every lookup.
+_kernel_path_override: str = os.environ.get("OKLCH_GRADE_KERNEL_PATH", "").strip()
+# Separate from the cached value so a failed lookup (None) is also remembered.
+_kernel_path_probed = False
+
+
+def _invalidate_kernel_path_cache() -> None:
+    """Forget the resolved kernel path so the next lookup re-probes disk."""
+    global _kernel_path_cache, _kernel_path_override, _kernel_path_probed
+    _kernel_path_cache = None
+    _kernel_path_override = os.environ.get("OKLCH_GRADE_KERNEL_PATH", "").strip()
+    _kernel_path_probed = False
+
+
+try:
+    # Long-running sessions may repoint install paths between scripts.
+    nuke.addOnScriptClose(_invalidate_kernel_path_cache)
+except Exception:
+    pass
 
 
 def _find_kernel_absolute_path() -> Optional[str]:
-    global _kernel_path_cache, _kernel_path_cache_override
-    override = os.environ.get("OKLCH_GRADE_KERNEL_PATH", "").strip()
-    if override == _kernel_path_cache_override and _kernel_path_cache is not None:
+    """Return the kernel's absolute, normalized path (memoized)."""
+    global _kernel_path_cache, _kernel_path_probed
+    if _kernel_path_probed:
         return _kernel_path_cache
-    _kernel_path_cache_override = override
+    _kernel_path_probed = True
+    _kernel_path_cache = None
 
+    override = _kernel_path_override
     if override and os.path.isfile(override):
         _kernel_path_cache = os.path.abspath(override)
         return _kernel_path_cache
 
-    here = os.path.abspath(os.path.dirname(__file__))
-    # callbacks.py lives in .../gizmos, kernel is in sibling ../blink
-    candidate = os.path.normpath(os.path.join(here, "..", _KERNEL_SOURCE_RELATIVE))
+    # Kernel is in sibling ../blink
+    candidate = os.path.normpath(os.path.join(_MODULE_DIR, "..", _KERNEL_SOURCE_RELATIVE))
     if os.path.isfile(candidate):
         _kernel_path_cache = candidate
         return _kernel_path_cache
 
     # Fallback for installs where plugin paths vary (repo root, src, gizmos).
+    # isfile() resolves ".." itself; only the winning path is normalized.
     for plugin_path in nuke.pluginPath() or []:
         plugin_path = os.path.abspath(plugin_path)
         candidates = (
@@ -371,33 +563,45 @@ def _find_kernel_absolute_path() -> Optional[str]:
             os.path.join(plugin_path, "..", "src", _KERNEL_SOURCE_RELATIVE),
         )
         for path in candidates:
-            path = os.path.normpath(path)
             if os.path.isfile(path):
-                _kernel_path_cache = path
+                _kernel_path_cache = os.path.normpath(path)
                 return _kernel_path_cache
 
     return None
 
 
-def _set_kernel_source_file_absolute(blink: Optional[nuke.Node]) -> bool:
-    """Set kernelSourceFile in file-mode using absolute path.
+def _prefetch_kernel_source() -> None:
+    """Warm the kernel source cache while the module loads.
 
-    Returns True when a path was set.
+    Only Nuke < 16 pushes the kernel inline; init.py imports this module at
+    startup, so the first node created does not read the file.  Interactive
+    sessions only: headless renders of scripts without an OKLCH node must
+    not touch the kernel file.
     """
-    kernel_source_file = _knob(blink, "kernelSourceFile")
-    if kernel_source_file is None:
-        return False
-
+    if _NUKE_MAJOR >= 16 or not getattr(nuke, "GUI", False):
+        return
     kernel_path = _find_kernel_absolute_path()
-    if not kernel_path:
-        return False
+    if kernel_path:
+        _read_kernel_source(kernel_path)
+    else:
+        # Plugin paths may still be incomplete at startup; probe again later.
+        _invalidate_kernel_path_cache()
 
-    try:
-        current = os.path.normpath(str(kernel_source_file.value()))
-    except Exception:
-        current = ""
 
-    if current == os.path.normpath(kernel_path):
+_prefetch_kernel_source()
+
+
+def _set_kernel_source_file_absolute(blink: Optional[nuke.Node], kernel_path: str, current: str) -> bool:
+    """Set kernelSourceFile in file-mode using absolute path.
+
+    ``kernel_path`` and ``current`` (the knob's value) must already be
+    normalized. Returns True when a path was set.
+    """
+    if not kernel_path or current == kernel_path:
+        return False
+
+    kernel_source_file = _knob(blink, "kernelSourceFile")
+    if kernel_source_file is None:
         return False
 
     try:
@@ -417,106 +621,37 @@ def _kernel_source_file_value(blink: Optional[nuke.Node]) -> str:
         return ""
 
 
-def _is_kernel_source_file_mode(blink: Optional[nuke.Node], kernel_path: str) -> bool:
-    if not kernel_path:
-        return False
-    current_raw = _kernel_source_file_value(blink)
-    if not current_raw:
-        return False
-    try:
-        current = os.path.normpath(current_raw)
-    except Exception:
-        return False
-    return current == os.path.normpath(kernel_path)
-
-
-def _apply_legacy_blink_compat(blink: Optional[nuke.Node]) -> bool:
-    """Apply pre-16 Blink compatibility. Returns True when state changed."""
-    if blink is None or _nuke_major_version() >= 16:
-        return False
-
-    changed = False
-
-    for baked_name in ("isBaked", "isbaked"):
-        baked_knob = _knob(blink, baked_name)
-        if baked_knob is not None:
-            try:
-                current = bool(baked_knob.value())
-            except Exception:
-                current = True
-            if current:
-                try:
-                    baked_knob.setValue(False)
-                    changed = True
-                except Exception:
-                    pass
-            break
-    for kernel_name in ("KernelDescription", "kernelDescription"):
-        kernel_desc_knob = _knob(blink, kernel_name)
-        if kernel_desc_knob is not None:
-            try:
-                current = str(kernel_desc_knob.value())
-            except Exception:
-                current = "nonempty"
-            if current:
-                try:
-                    # Empty value so legacy Nuke saves without embedded KernelDescription payload.
-                    kernel_desc_knob.setValue("")
-                    changed = True
-                except Exception:
-                    pass
-            break
-    return changed
-
-
-def _needs_legacy_recompile(blink: Optional[nuke.Node]) -> bool:
-    """True when legacy mode is active, even if no value changed this pass."""
-    if blink is None or _nuke_major_version() >= 16:
-        return False
-
-    for kernel_name in ("KernelDescription", "kernelDescription"):
-        kernel_desc_knob = _knob(blink, kernel_name)
-        if kernel_desc_knob is not None:
-            try:
-                if str(kernel_desc_knob.value()):
-                    return True
-            except Exception:
-                return True
-            return False
-    return False
+def _is_kernel_source_file_mode(current: str, kernel_path: str) -> bool:
+    """``current`` and ``kernel_path`` must already be normalized."""
+    return bool(kernel_path) and current == kernel_path
 
 
 def _prepare_blink_params(node: Optional[nuke.Node], force_recompile: bool) -> tuple[Optional[nuke.Node], list[str]]:
     """Ensure Blink param knobs exist before linking group knobs."""
     _debug(f"prepare_blink_params start force_recompile={force_recompile}", node=node)
     if node is None:
-        return None, [internal_name for _, _, internal_name, _ in _PARAM_LINKS]
+        return None, list(_ALL_INTERNAL_NAMES)
 
     blink = node.node("BlinkScript_OKLCHGrade")
     if blink is None:
-        return None, [internal_name for _, _, internal_name, _ in _PARAM_LINKS]
+        return None, list(_ALL_INTERNAL_NAMES)
 
     kernel_path = _find_kernel_absolute_path()
     if not kernel_path:
         _debug("prepare_blink_params missing kernel path", node=node)
-        _set_status(
-            node,
-            (
-                "<font color='#cc6666'><small><b>Status:</b> "
-                "Kernel file not found. Expected oklch_grade_kernel.cpp in the install tree."
-                "</small></font>"
-            ),
-        )
-        return blink, [internal_name for _, _, internal_name, _ in _PARAM_LINKS]
+        _set_status(node, _STATUS_KERNEL_NOT_FOUND)
+        return blink, list(_ALL_INTERNAL_NAMES)
 
     # Nuke < 16: file-mode compile does not reliably materialize param knobs,
     # and isBaked/KernelDescription from a Nuke 16 gizmo cannot be cleared at
     # runtime.  Go straight to inline kernelSource (read .cpp, set knob value,
     # recompile).
-    if _nuke_major_version() < 16:
-        if _set_kernel_source_inline_from_file(blink):
+    if _NUKE_MAJOR < 16:
+        source_changed = _set_kernel_source_inline_from_file(blink)
+        missing = [] if source_changed else _collect_missing_params(blink)
+        if source_changed or force_recompile or missing:
             _run_recompile(blink)
-        missing = _missing_param_knobs(blink)
+            missing = _collect_missing_params(blink)
         _debug(
             f"prepare_blink_params legacy_mode missing={len(missing)}",
             node=node,
@@ -524,26 +659,31 @@ def _prepare_blink_params(node: Optional[nuke.Node], force_recompile: bool) -> t
         return blink, missing
 
     # Nuke >= 16: prefer non-executing path unless param knobs are missing.
-    kernel_file_changed = _set_kernel_source_file_absolute(blink)
-    kernel_file_mode = _is_kernel_source_file_mode(blink, kernel_path)
+    # kernelSourceFile is read once per pass and reused by both checks below.
+    current_raw = _kernel_source_file_value(blink)
+    current_path = os.path.normpath(current_raw) if current_raw else ""
+    kernel_file_changed = _set_kernel_source_file_absolute(blink, kernel_path, current_path)
+    if kernel_file_changed:
+        current_raw = current_path = kernel_path
+    kernel_file_mode = _is_kernel_source_file_mode(current_path, kernel_path)
     if not kernel_file_mode:
         # Soft-fail: many deployments work via embedded kernelSource and still
         # expose all param knobs correctly.
-        current = _escape_html(_kernel_source_file_value(blink) or "<empty>")
+        current = _escape_html(current_raw or "<empty>")
         target = _escape_html(kernel_path)
         _debug(
             f"prepare_blink_params kernel file mode mismatch current={current} target={target}",
             node=node,
         )
 
-    missing_before = _missing_param_knobs(blink)
+    missing_before = _collect_missing_params(blink)
     needs_compile = force_recompile or bool(missing_before)
     if needs_compile:
         if kernel_file_changed:
             _run_reload_kernel_source_file(blink)
         _run_recompile(blink)
 
-    missing = _missing_param_knobs(blink)
+    missing = _collect_missing_params(blink)
     _debug(
         (
             "prepare_blink_params done "
@@ -559,38 +699,118 @@ def _prepare_blink_params(node: Optional[nuke.Node], force_recompile: bool) -> t
     return blink, missing
 
 
-def _apply_colorspace_defaults(node: Optional[nuke.Node]) -> None:
-    if node is None:
-        return
+_LINEAR_SRGB_ALIASES = ("Utility - Linear - sRGB", "lin_srgb", "Linear sRGB", "srgb_linear")
+_ALIAS_SET = frozenset(_LINEAR_SRGB_ALIASES)
+# Lower-cased alias -> priority (0 is best) for the case-insensitive pass.
+_ALIAS_RANK = {alias.lower(): rank for rank, alias in enumerate(_LINEAR_SRGB_ALIASES)}
+
+# The OCIO config rarely changes mid-session, so the working space is
+# detected once per active config: {config key: working space or ""}.
+_OCIO_CACHE: dict[str, str] = {}
+
+# Root knobs that select the active OCIO config alongside $OCIO.
+_ROOT_OCIO_KNOBS = ("OCIO_config", "customOCIOConfigPath")
+
+
+def _invalidate_ocio_cache() -> None:
+    _OCIO_CACHE.clear()
+
+
+def _ocio_cache_key() -> str:
+    parts = [os.environ.get("OCIO", "")]
+    try:
+        root = nuke.root()
+        for name in _ROOT_OCIO_KNOBS:
+            knob = root.knob(name)
+            if knob is not None:
+                parts.append(str(knob.value()))
+    except Exception:
+        pass
+    return "|".join(parts)
 
-    spaces = nuke.getOcioColorSpaces() or []
-    aliases = ("Utility - Linear - sRGB", "lin_srgb", "Linear sRGB", "srgb_linear")
 
-    working = ""
-    for alias in aliases:
-        if alias in spaces:
-            working = alias
+try:
+    # A newly loaded script may carry its own OCIO config in Root settings.
+    nuke.addOnScriptLoad(_invalidate_ocio_cache)
+except Exception:
+    pass
+
+
+def _detect_working_space(spaces: list[str]) -> str:
+    present = _ALIAS_SET.intersection(spaces)
+    if present:
+        for alias in _LINEAR_SRGB_ALIASES:
+            if alias in present:
+                return alias
+
+    # One pass, one lower() per name: case-insensitive alias hits ranked by
+    # priority, then the first name containing both "linear" and "srgb".
+    fallback_rank = len(_ALIAS_RANK)
+    best_rank = fallback_rank + 1
+    best = ""
+    for value in spaces:
+        low = value.lower()
+        rank = _ALIAS_RANK.get(low, fallback_rank)
+        if rank >= best_rank:
+            continue
+        if rank == fallback_rank and not ("linear" in low and "srgb" in low):
+            continue
+        best_rank, best = rank, value
+        if rank == 0:
             break
+    return best
 
-    if not working:
-        lowered = {value.lower(): value for value in spaces}
-        for alias in aliases:
-            hit = lowered.get(alias.lower())
-            if hit:
-                working = hit
-                break
 
-    if not working:
-        for value in spaces:
-            low = value.lower()
-            if "linear" in low and "srgb" in low:
-                working = value
-                break
+def _resolve_working_space() -> str:
+    ocio = _ocio_cache_key()
+    cached = _OCIO_CACHE.get(ocio)
+    if cached is not None:
+        return cached
+    working = _detect_working_space(list(nuke.getOcioColorSpaces() or []))
+    _OCIO_CACHE[ocio] = working
+    return working
 
-    status = (
-        "<font color='#777777'><small><b>Status:</b> Note: no linear-sRGB alias found. "
-        "Falling back to scene_linear.</small></font>"
-    )
+
+# Status colours used for errors and warnings that must not be overwritten.
+_PROBLEM_STATUS_RE = re.compile(r"#cc6666|#cc9966", re.IGNORECASE)
+
+# Nodes (by fullName) whose colorspace defaults were applied this session.
+# Applied lazily on first panel open so script load never queries OCIO.
+_COLORSPACE_APPLIED: set[str] = set()
+
+
+def _invalidate_colorspace_applied() -> None:
+    _COLORSPACE_APPLIED.clear()
+
+
+try:
+    # Node names are reused across scripts; re-apply defaults after a switch.
+    nuke.addOnScriptLoad(_invalidate_colorspace_applied)
+    nuke.addOnScriptClose(_invalidate_colorspace_applied)
+except Exception:
+    pass
+
+
+def _apply_colorspace_defaults_once(node: Optional[nuke.Node]) -> None:
+    if node is None:
+        return
+    name = _node_name(node)
+    if name in _COLORSPACE_APPLIED:
+        return
+    _COLORSPACE_APPLIED.add(name)
+    _apply_colorspace_defaults(node)
+
+
+def _apply_colorspace_defaults(node: Optional[nuke.Node], keep_problem: bool = True) -> None:
+    """Store the detected working space and show it in the status line.
+
+    With ``keep_problem`` an error/warning status is left in place; a clean
+    sync passes False so a stale problem status is replaced.
+    """
+    if node is None:
+        return
+
+    working = _resolve_working_space()
     if working:
         wk = _knob(node, "working_linear_srgb_space")
         if wk is not None:
@@ -598,10 +818,26 @@ def _apply_colorspace_defaults(node: Optional[nuke.Node]) -> None:
                 wk.setValue(working)
             except Exception:
                 pass
-        safe = working.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        status = f"<font color='#66AA66'><small><b>Status:</b> OK (working space: {safe})</small></font>"
 
-    _set_status(node, status)
+    status_knob = _knob(node, "status_text")
+    if status_knob is None:
+        return
+    try:
+        current = str(status_knob.value())
+    except Exception:
+        current = ""
+    if keep_problem and _PROBLEM_STATUS_RE.search(current):
+        # Keep sync errors/warnings visible; they are more useful than "OK".
+        return
+
+    if working:
+        status = _STATUS_WORKING_SPACE_OK_FMT.format(space=_escape_html(working))
+    else:
+        status = _STATUS_NO_LINEAR_ALIAS
+    try:
+        status_knob.setValue(status)
+    except Exception:
+        pass
 
 
 def _ensure_hue_lut_format() -> None:
@@ -676,11 +912,12 @@ def _apply_expression_lut_from_data(node: Optional[nuke.Node]) -> bool:
     expr_lut = _hcd.points_to_lut_expression(points, x_var="lutx")
 
     try:
-        temp_name0 = _knob(expr, "temp_name0")
-        temp_expr0 = _knob(expr, "temp_expr0")
-        expr0 = _knob(expr, "expr0")
-        expr1 = _knob(expr, "expr1")
-        expr2 = _knob(expr, "expr2")
+        expr_knobs = expr.knobs()
+        temp_name0 = expr_knobs.get("temp_name0")
+        temp_expr0 = expr_knobs.get("temp_expr0")
+        expr0 = expr_knobs.get("expr0")
+        expr1 = expr_knobs.get("expr1")
+        expr2 = expr_knobs.get("expr2")
         if temp_name0 is not None:
             temp_name0.setValue("lutx")
         if temp_expr0 is not None:
@@ -735,8 +972,10 @@ def _sync_hue_lut_state(node: Optional[nuke.Node]) -> None:
     except Exception:
         connected = False
 
-    _set_blink_param_if_exists(blink, "hue_lut_width", "hue_lut_width", width)
-    _set_blink_param_if_exists(blink, "hue_lut_connected", "hue_lut_connected", connected)
+    # Param knobs don't change during this pass; one snapshot serves every write.
+    blink_knobs = blink.knobs()
+    _set_blink_param_if_exists(blink, "hue_lut_width", "hue_lut_width", width, blink_knobs)
+    _set_blink_param_if_exists(blink, "hue_lut_connected", "hue_lut_connected", connected, blink_knobs)
     _ensure_hue_curve_data(node, legacy_huecorrect)
     _apply_expression_lut_from_data(node)
 
@@ -755,24 +994,18 @@ def _sync_hue_lut_state(node: Optional[nuke.Node]) -> None:
             "hue_curves_enable",
             "hue_curves_enable",
             curves_requested,
+            blink_knobs,
         )
 
     if not connected:
-        _set_blink_param_if_exists(blink, "hue_curves_enable", "hue_curves_enable", False)
+        _set_blink_param_if_exists(blink, "hue_curves_enable", "hue_curves_enable", False, blink_knobs)
         if hue_curves_knob is not None:
             try:
                 hue_curves_knob.setValue(False)
             except Exception:
                 pass
         if curves_requested:
-            _set_status(
-                node,
-                (
-                    "<font color='#cc9966'><small><b>Status:</b> "
-                    "Hue Curves disabled: missing internal LUT helper nodes in this instance."
-                    "</small></font>"
-                ),
-            )
+            _set_status(node, _STATUS_HUE_CURVES_DISABLED)
     _debug(
         f"sync_hue_lut_state width={width} connected={connected} curves_requested={curves_requested}",
         node=node,
@@ -799,52 +1032,75 @@ def _resolve_callback_node() -> Optional[nuke.Node]:
     return None
 
 
+def _sync_token() -> Optional[tuple[str, int]]:
+    kernel_path = _find_kernel_absolute_path()
+    if not kernel_path:
+        return None
+    try:
+        return kernel_path, os.stat(kernel_path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def _sync_links(node: Optional[nuke.Node], force_recompile: bool) -> int:
     """Resolve and set link targets. Returns number of unresolved controls."""
     if node is None:
         return 0
 
-    blink, missing = _prepare_blink_params(node, force_recompile=force_recompile)
+    token = _sync_token()
+    token_matched = False
+    if not force_recompile and token is not None:
+        blink = node.node("BlinkScript_OKLCHGrade")
+        token_matched = blink is not None and _SYNC_TOKENS.get(_node_name(blink)) == token
+    if token_matched:
+        # Kernel unchanged since the last clean pass: skip the kernel
+        # write/recompile path, but still verify every link below.
+        missing: list[str] = []
+        _debug("sync_links: token unchanged, verifying links only", node=node)
+    else:
+        blink, missing = _prepare_blink_params(node, force_recompile=force_recompile)
     if blink is None:
-        _set_status(
-            node,
-            "<font color='#cc6666'><small><b>Status:</b> BlinkScript node not ready yet.</small></font>",
-        )
+        _set_status(node, _STATUS_BLINK_NOT_READY)
         _debug("sync_links: blink not ready", node=node)
         return len(_PARAM_LINKS)
 
     if missing:
         _set_status(
             node,
-            (
-                "<font color='#cc6666'><small><b>Status:</b> Blink kernel params missing after compile: "
-                f"{', '.join(missing[:6])}{'...' if len(missing) > 6 else ''}.</small></font>"
+            _STATUS_PARAMS_MISSING_FMT.format(
+                names=", ".join(missing[:6]),
+                more="..." if len(missing) > 6 else "",
             ),
         )
         _debug(f"sync_links: missing blink params count={len(missing)}", node=node)
         return len(_PARAM_LINKS)
 
+    node_knobs = node.knobs()
+    blink_knobs = blink.knobs()
+    cache = _resolve_cache_for(blink)
+    blink_name = _node_name(blink)
+    apply_ranges = blink_name not in _RANGES_SET
     unresolved = 0
-    for public_name, label, internal_name, value_range in _PARAM_LINKS:
-        public_knob = _knob(node, public_name)
+    for public_name, internal_name, candidates, lo, hi, has_range in _PARAM_LINKS_FLAT:
+        public_knob = node_knobs.get(public_name)
         if public_knob is None:
             continue
 
-        if value_range is not None:
-            lo, hi = value_range
+        has_range = has_range and apply_ranges
+        if has_range:
             try:
                 public_knob.setRange(lo, hi)
             except Exception:
                 pass
 
-        resolved_name = _resolve_blink_knob_name(blink, label, internal_name)
+        resolved_name, blink_knob = _resolve_blink_knob_name(
+            blink_knobs, internal_name, candidates, cache
+        )
         if not resolved_name:
             unresolved += 1
             continue
 
-        blink_knob = _knob(blink, resolved_name)
-        if value_range is not None and blink_knob is not None:
-            lo, hi = value_range
+        if has_range:
             try:
                 blink_knob.setRange(lo, hi)
             except Exception:
@@ -870,6 +1126,15 @@ def _sync_links(node: Optional[nuke.Node], force_recompile: bool) -> int:
             except Exception:
                 unresolved += 1
 
+    if not unresolved:
+        _RANGES_SET.add(blink_name)
+        if token is not None:
+            _SYNC_TOKENS[blink_name] = token
+        if _PROBLEM_STATUS_RE.search(_status_value(node)):
+            # An error from an earlier pass (or saved in the script) no
+            # longer applies; hue LUT warnings are re-raised by the caller.
+            _COLORSPACE_APPLIED.add(_node_name(node))
+            _apply_colorspace_defaults(node, keep_problem=False)
     _debug(f"sync_links done unresolved={unresolved} force_recompile={force_recompile}", node=node)
     return unresolved
 
@@ -897,7 +1162,9 @@ def _initialize_this_node_impl() -> None:
     _debug("initialize_impl start", node=node)
     _diag_dump("onCreate_START", node)
     _ensure_hue_lut_format()
-    _apply_colorspace_defaults(node)
+    # A recreated node can reuse a previous node's name; never trust its caches.
+    _invalidate_blink_caches(node.node("BlinkScript_OKLCHGrade"))
+    _COLORSPACE_APPLIED.discard(_node_name(node))
     unresolved = _sync_links(node, force_recompile=False)
     if unresolved:
         # One more forced pass for legacy setups where params appear after
@@ -905,16 +1172,9 @@ def _initialize_this_node_impl() -> None:
         unresolved = _sync_links(node, force_recompile=True)
     _sync_hue_lut_state(node)
     if unresolved:
-        if "#cc6666" in _status_value(node).lower():
+        if _ERR_COLOR_RE.search(_status_value(node)):
             return
-        _set_status(
-            node,
-            (
-                "<font color='#cc6666'><small><b>Status:</b> "
-                "{} linked controls are unresolved. Open BlinkScript node and click Recompile."
-                "</small></font>"
-            ).format(unresolved),
-        )
+        _set_status(node, _STATUS_UNRESOLVED_FMT.format(count=unresolved))
     _diag_dump("onCreate_END", node)
     _debug(f"initialize_impl end unresolved={unresolved}", node=node)
 
@@ -956,6 +1216,8 @@ def handle_this_knob_changed() -> None:
 
 def _handle_this_knob_changed_impl(node: Optional[nuke.Node], knob_name: str = "") -> None:
     if knob_name in _LIGHTWEIGHT_SYNC_KNOBS:
+        if knob_name == "showPanel":
+            _apply_colorspace_defaults_once(node)
         _sync_hue_lut_state(node)
         _debug(f"handle_impl lightweight_sync knob={knob_name}", node=node)
         return
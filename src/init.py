@@ -4,6 +4,8 @@ Nuke startup bootstrap (non-UI).
 Purpose:
 - register the bundled `gizmos` plugin directory so gizmos/icons are available
   in GUI and headless sessions.
+- pre-import the gizmo callbacks so the first node created does not pay the
+  module import.
 
 UI concerns (toolbar/menu commands) are handled in `menu.py`.
 """
@@ -33,4 +35,16 @@ def _bootstrap_python_imports() -> None:
             sys.path.insert(0, nuke_dir)
 
 
+def _preload_callbacks() -> None:
+    if nuke is None:
+        return
+    try:
+        # The gizmo's onCreate/knobChanged scripts re-import this by name;
+        # loading it here turns those into sys.modules hits.
+        import oklch_grade_callbacks  # noqa: F401
+    except Exception:
+        pass
+
+
 _bootstrap_python_imports()
+_preload_callbacks()
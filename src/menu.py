@@ -3,30 +3,28 @@ Nuke UI bootstrap.
 
 Nuke executes `menu.py` for each directory in NUKE_PATH when running with UI.
 This file registers the gizmo directory and adds a Nodes menu command.
+It is the only UI bootstrap: the repository-root `init.py` adds `src/` to the
+plugin path, so this file also runs for repo-root installs.
 """
 
 import os
 
 import nuke
 
-_this_dir = os.path.dirname(os.path.abspath(__file__))
-_gizmos_dir = os.path.join(_this_dir, "gizmos")
-_icons_dir = os.path.join(_gizmos_dir, "icons")
+# Kept on the `nuke` module rather than as a module global: Nuke executes each
+# menu.py afresh, so only state on `nuke` survives a second execution.
 _MENU_GUARD_ATTR = "_oklch_grade_menu_registered"
 
-nuke.pluginAddPath(_gizmos_dir)
-nuke.pluginAddPath(_icons_dir)
 
-def _add_menu_entries() -> None:
-    if getattr(nuke, _MENU_GUARD_ATTR, False):
-        return
+def _canonical_path(path: str) -> str:
+    return os.path.normcase(os.path.realpath(path))
+
 
+def _add_menu_entries(icon: str) -> bool:
     nodes_menu = nuke.menu("Nodes")
     if nodes_menu is None:
-        return
+        return False
 
-    icon_path = os.path.join(_icons_dir, "oklch_grade.png")
-    icon = icon_path if os.path.isfile(icon_path) else "oklch_grade.png"
     command = "nuke.createNode('OKLCH_Grade')"
 
     # Keep the canonical Color location.
@@ -34,8 +32,31 @@ def _add_menu_entries() -> None:
     # Also expose top-level entry to avoid discoverability regressions.
     top = nodes_menu.addMenu("OKLCH", icon=icon)
     top.addCommand("OKLCH Grade", command, icon=icon)
+    return True
+
 
-    setattr(nuke, _MENU_GUARD_ATTR, True)
+def _bootstrap() -> None:
+    # One guard for all UI bootstrap work: repeat executions are a single
+    # attribute check, with no path work before it.
+    if getattr(nuke, _MENU_GUARD_ATTR, False):
+        return
+
+    this_dir = os.path.dirname(os.path.abspath(__file__))
+    gizmos_dir = os.path.join(this_dir, "gizmos")
+    icons_dir = os.path.join(gizmos_dir, "icons")
+    icon_path = os.path.join(icons_dir, "oklch_grade.png")
+
+    # src/init.py has usually registered gizmos/ already; only add what is
+    # missing so the plugin path does not carry duplicate entries.  Compare
+    # canonical forms so trailing slashes, symlinks and case do not slip by.
+    registered = {_canonical_path(p) for p in nuke.pluginPath()}
+    for path in (gizmos_dir, icons_dir):
+        if _canonical_path(path) not in registered:
+            nuke.pluginAddPath(path)
+
+    icon = icon_path if os.path.isfile(icon_path) else "oklch_grade.png"
+    if _add_menu_entries(icon):
+        setattr(nuke, _MENU_GUARD_ATTR, True)
 
 
-_add_menu_entries()
+_bootstrap()
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 import os
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import nuke
 
@@ -13,9 +14,13 @@ LINEAR_SRGB_ALIASES = (
     "Linear sRGB",
     "srgb_linear",
 )
+_ALIAS_SET = frozenset(LINEAR_SRGB_ALIASES)
+# Lower-cased alias -> priority (0 is best) for the case-insensitive pass.
+_ALIAS_RANK = {alias.lower(): rank for rank, alias in enumerate(LINEAR_SRGB_ALIASES)}
 
 # NO_RERENDER flag — prevents divider knobs from dirtying the node hash.
-_NO_RERENDER = 0x0000000000004000
+# Prefer the API constant; the literal covers builds that do not export it.
+_NO_RERENDER = getattr(nuke, "NO_RERENDER", 0x0000000000004000)
 
 # Used only by _add_link_knobs — order determines panel appearance.
 # Tuples: (knob_name, label, link_target).
@@ -92,6 +97,8 @@ _PARAM_RANGES = {
     # Utilities
     "mix":                  (0.0,    1.0),
 }
+# Flattened once for _apply_param_ranges: (knob_name, lo, hi).
+_PARAM_RANGE_ITEMS = tuple((name, lo, hi) for name, (lo, hi) in _PARAM_RANGES.items())
 
 _COLORSPACE_LINK_DEFS = (
     ("input_colorspace",  "Input Colorspace",  "OCIOColorSpace_IN.in_colorspace"),
@@ -99,11 +106,26 @@ _COLORSPACE_LINK_DEFS = (
     ("",                  "",                  None),  # ── divider ──
 )
 
+# Panel order used by _add_link_knobs: colorspaces first, then grade params.
+_ALL_LINK_DEFS = _COLORSPACE_LINK_DEFS + _GRADE_LINK_DEFS
+
 
 def _knob(node: nuke.Node, name: str):
     return node.knob(name)
 
 
+@contextmanager
+def _undo_disabled() -> Iterator[None]:
+    """Keep internal setup edits off the undo stack, restoring prior state."""
+    was_disabled = nuke.Undo.disabled()
+    nuke.Undo.disable()
+    try:
+        yield
+    finally:
+        if not was_disabled:
+            nuke.Undo.enable()
+
+
 def _is_oklch_group_node(node: nuke.Node) -> bool:
     """Return True when `node` is the top-level OKLCH gizmo Group."""
     try:
@@ -112,66 +134,133 @@ def _is_oklch_group_node(node: nuke.Node) -> bool:
         return False
 
 
-def _ensure_base_knobs(group_node: nuke.Node) -> None:
+# (name, factory) for the knobs _ensure_base_knobs creates, in panel order.
+_BASE_KNOB_FACTORIES = (
+    ("OKLCHGrade", lambda: nuke.Tab_Knob("OKLCHGrade", "OKLCH Grade")),
+    ("status_text", lambda: nuke.Text_Knob("status_text", "Status", "Initializing...")),
+    ("working_linear_srgb_space", lambda: nuke.String_Knob("working_linear_srgb_space", "Working Linear sRGB")),
+)
+_BASE_KNOB_NAMES = frozenset(name for name, _ in _BASE_KNOB_FACTORIES)
+
+
+def _ensure_base_knobs(group_node: nuke.Node, existing: Optional[set] = None) -> None:
     """Ensure the main tab and foundational public/tech knobs exist.
 
     The `OKLCH Grade` tab, `status_text`, and `working_linear_srgb_space` are
     created here (at runtime) so all subsequently added controls share the same
     tab ownership model. Mixing static gizmo-defined knobs with dynamic
     addKnob() calls can cause runtime-added knobs to land in `User`.
+
+    ``existing`` is an optional knob-name snapshot shared with
+    _add_link_knobs; names added here are recorded in it.
     """
-    if group_node.knob("OKLCHGrade") is None:
-        group_node.addKnob(nuke.Tab_Knob("OKLCHGrade", "OKLCH Grade"))
+    if existing is None:
+        existing = set(group_node.knobs())
+    if _BASE_KNOB_NAMES.issubset(existing):
+        return
+    # Tuple order is panel order: the tab must be added first.
+    for name, factory in _BASE_KNOB_FACTORIES:
+        if name not in existing:
+            group_node.addKnob(factory())
+            existing.add(name)
 
-    if group_node.knob("status_text") is None:
-        group_node.addKnob(nuke.Text_Knob("status_text", "Status", "Initializing..."))
 
-    if group_node.knob("working_linear_srgb_space") is None:
-        wk = nuke.String_Knob("working_linear_srgb_space", "Working Linear sRGB")
-        wk.setValue("")
-        group_node.addKnob(wk)
+# {config key: (deduplicated colorspaces, detected linear-sRGB alias)}.
+_OCIO_CACHE: Dict[str, Tuple[List[str], Optional[str]]] = {}
 
+# Root knobs that select the active OCIO config alongside $OCIO.
+_ROOT_OCIO_KNOBS = ("OCIO_config", "customOCIOConfigPath")
 
-def get_ocio_colorspaces() -> List[str]:
-    """Return colorspaces from the active OCIO config via nuke.getOcioColorSpaces()."""
+
+def invalidate_ocio_cache() -> None:
+    """Drop cached colorspaces, e.g. after editing the active config file."""
+    _OCIO_CACHE.clear()
+
+
+def _ocio_cache_key() -> str:
+    """Identify the active OCIO config from $OCIO and the Root config knobs."""
+    parts = [os.environ.get("OCIO", "")]
+    try:
+        root = nuke.root()
+        for name in _ROOT_OCIO_KNOBS:
+            k = root.knob(name)
+            if k is not None:
+                parts.append(str(k.value()))
+    except Exception:
+        pass
+    return "|".join(parts)
+
+
+def _ocio_state() -> Tuple[List[str], Optional[str]]:
+    key = _ocio_cache_key()
+    cached = _OCIO_CACHE.get(key)
+    if cached is not None:
+        return cached
     try:
         values = nuke.getOcioColorSpaces()
     except Exception:
-        return []
-    if not values:
-        return []
+        # Not cached: the OCIO config may simply not be loaded yet.
+        return [], None
     seen: set = set()
     result: List[str] = []
-    for v in values:
+    for v in values or ():
         if v not in seen:
             result.append(v)
             seen.add(v)
-    return result
+    state = (result, detect_linear_srgb_space(result))
+    _OCIO_CACHE[key] = state
+    return state
+
+
+def get_ocio_colorspaces() -> List[str]:
+    """Return colorspaces from the active OCIO config via nuke.getOcioColorSpaces()."""
+    return list(_ocio_state()[0])
+
+
+def get_linear_srgb_space() -> Optional[str]:
+    """Return the linear-sRGB alias detected for the active OCIO config."""
+    return _ocio_state()[1]
 
 
 def detect_linear_srgb_space(colorspaces: Iterable[str]) -> Optional[str]:
-    """Pick the best linear-sRGB colorspace alias from the active OCIO config."""
+    """Pick the best linear-sRGB colorspace alias from the active OCIO config.
+
+    Same search as ``_detect_working_space`` in the runtime callbacks module.
+    """
     colorspaces = list(colorspaces)
-    
+
     # 1. Exact alias match (prioritized list)
-    for alias in LINEAR_SRGB_ALIASES:
-        if alias in colorspaces:
-            return alias
-            
-    # 2. Case-insensitive alias match
-    lowered = {v.lower(): v for v in colorspaces}
-    for alias in LINEAR_SRGB_ALIASES:
-        hit = lowered.get(alias.lower())
-        if hit:
-            return hit
-            
-    # 3. Aggressive search for 'linear' AND 'srgb'
+    present = _ALIAS_SET.intersection(colorspaces)
+    if present:
+        for alias in LINEAR_SRGB_ALIASES:
+            if alias in present:
+                return alias
+
+    # 2. Case-insensitive alias match, ranked by priority, and
+    # 3. aggressive search for 'linear' AND 'srgb' as the lowest rank.
+    # One pass with a single lower() per name.
+    fallback_rank = len(_ALIAS_RANK)
+    best_rank = fallback_rank + 1
+    best: Optional[str] = None
     for v in colorspaces:
         v_low = v.lower()
-        if "linear" in v_low and "srgb" in v_low:
-            return v
-            
-    return None
+        rank = _ALIAS_RANK.get(v_low, fallback_rank)
+        if rank >= best_rank:
+            continue
+        if rank == fallback_rank and not ("linear" in v_low and "srgb" in v_low):
+            continue
+        best_rank, best = rank, v
+        if rank == 0:
+            break
+
+    return best
+
+
+try:
+    # A newly loaded script may carry its own OCIO config in Root settings.
+    nuke.addOnScriptLoad(invalidate_ocio_cache)
+except Exception:
+    pass
 
 
 def _set_text(node: nuke.Node, knob_name: str, value: str) -> None:
@@ -190,36 +279,88 @@ def _has_link_knobs(node: nuke.Node) -> bool:
 
 
 def _hide_tech_knobs(node: nuke.Node) -> None:
-    for name in ("working_linear_srgb_space",):
-        k = _knob(node, name)
-        if k is None:
-            continue
-        try:
-            k.setFlag(nuke.INVISIBLE)
-        except Exception:
-            pass
+    k = _knob(node, "working_linear_srgb_space")
+    if k is None:
+        return
+    try:
+        k.setFlag(nuke.INVISIBLE)
+    except Exception:
+        pass
 
 
-def _find_kernel_path() -> Optional[str]:
-    override = os.environ.get("OKLCH_GRADE_KERNEL_PATH", "").strip()
-    if override and os.path.isfile(override):
-        return override
+_MODULE_DIR = os.path.abspath(os.path.dirname(__file__))
+_KERNEL_REL = os.path.join("..", "blink", "oklch_grade_kernel.cpp")
+_BUNDLED_KERNEL_PATH = os.path.normpath(os.path.join(_MODULE_DIR, _KERNEL_REL))
+
+# OKLCH_GRADE_KERNEL_PATH is exported before Nuke starts, so the variable is
+# read once (at import, and again by _invalidate_kernel_path_cache).  The file
+# itself is re-checked on every lookup, like _KERNEL_PATH_CACHE.
+_KERNEL_PATH_OVERRIDE = ""
 
-    here = os.path.abspath(os.path.dirname(__file__))
-    candidate = os.path.normpath(os.path.join(here, "..", "blink", "oklch_grade_kernel.cpp"))
-    if os.path.isfile(candidate):
-        return candidate
+# Resolved path from the last search; revalidated with one isfile() per hit.
+_KERNEL_PATH_CACHE: Optional[str] = None
 
+
+def _invalidate_kernel_path_cache() -> None:
+    global _KERNEL_PATH_CACHE, _KERNEL_PATH_OVERRIDE
+    _KERNEL_PATH_CACHE = None
+    _KERNEL_PATH_OVERRIDE = os.environ.get("OKLCH_GRADE_KERNEL_PATH", "").strip()
+
+
+_invalidate_kernel_path_cache()
+
+try:
+    # Long-running sessions may repoint install paths between scripts.
+    nuke.addOnScriptClose(_invalidate_kernel_path_cache)
+except Exception:
+    pass
+
+
+def _find_kernel_path() -> Optional[str]:
+    """Return the kernel path; the plugin-path search runs only on a miss."""
+    global _KERNEL_PATH_CACHE
+    # A moved or deleted override falls through to the bundled kernel.
+    if _KERNEL_PATH_OVERRIDE and os.path.isfile(_KERNEL_PATH_OVERRIDE):
+        return _KERNEL_PATH_OVERRIDE
+    if _KERNEL_PATH_CACHE is not None and os.path.isfile(_KERNEL_PATH_CACHE):
+        return _KERNEL_PATH_CACHE
+    _KERNEL_PATH_CACHE = _search_kernel_path()
+    return _KERNEL_PATH_CACHE
+
+
+def _search_kernel_path() -> Optional[str]:
+    if os.path.isfile(_BUNDLED_KERNEL_PATH):
+        return _BUNDLED_KERNEL_PATH
+
+    # isfile() resolves ".." itself; only the winning path is normalized.
     for path in nuke.pluginPath():
-        candidate_p = os.path.normpath(
-            os.path.join(path, "..", "blink", "oklch_grade_kernel.cpp")
-        )
-        if os.path.isfile(candidate_p):
-            return candidate_p
+        candidate = os.path.join(path, _KERNEL_REL)
+        if os.path.isfile(candidate):
+            return os.path.normpath(candidate)
 
     return None
 
 
+# {kernel path: (st_mtime_ns, st_size, source)}; one stat validates a hit.
+_SOURCE_CACHE: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _read_kernel_source(path: str) -> str:
+    """Return the kernel source, re-reading only when the file changed.
+
+    Raises OSError like open() so callers can report the failure.
+    """
+    st = os.stat(path)
+    cached = _SOURCE_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with open(path, "rb") as fh:
+        # Normalise CRLF (autocrlf checkouts) as text-mode reads used to.
+        source = fh.read().decode("utf-8").replace("\r\n", "\n")
+    _SOURCE_CACHE[path] = (st.st_mtime_ns, st.st_size, source)
+    return source
+
+
 def _load_kernel_source(group_node: nuke.Node) -> bool:
     """Load the Blink kernel source into the BlinkScript node and recompile.
 
@@ -245,8 +386,7 @@ def _load_kernel_source(group_node: nuke.Node) -> bool:
     # mode, causing it to ignore the inline text and leaving the kernel
     # uncompiled (no param knobs appear, no Link_Knobs can be targeted).
     try:
-        with open(kernel_path, "r") as fh:
-            source = fh.read()
+        source = _read_kernel_source(kernel_path)
     except Exception as exc:
         _set_text(group_node, "status_text", f"Error reading kernel file: {exc}")
         return False
@@ -256,6 +396,16 @@ def _load_kernel_source(group_node: nuke.Node) -> bool:
         _set_text(group_node, "status_text", "Error: kernelSource knob not found on BlinkScript node.")
         return False
 
+    # A reopened script may already carry the identical inline source (and
+    # its compiled params); skip setValue + recompile then.
+    try:
+        compiled = (ks.value() or "") == source
+    except Exception:
+        compiled = False
+    if compiled and _knob(blink, "l_gain") is not None:
+        _apply_param_ranges(blink)
+        return True
+
     try:
         ks.setValue(source)
     except Exception as exc:
@@ -278,14 +428,19 @@ def _load_kernel_source(group_node: nuke.Node) -> bool:
         )
         return False
 
-    # Set meaningful UI ranges on the param knobs
-    for knob_name, (lo, hi) in _PARAM_RANGES.items():
-        k = _knob(blink, knob_name)
+    _apply_param_ranges(blink)
+    return True
+
+
+def _apply_param_ranges(blink: nuke.Node) -> None:
+    """Set meaningful UI ranges on the param knobs."""
+    # One knobs() snapshot; only knobs the kernel actually exposes are touched.
+    blink_knobs = blink.knobs()
+    for knob_name, lo, hi in _PARAM_RANGE_ITEMS:
+        k = blink_knobs.get(knob_name)
         if k:
             k.setRange(lo, hi)
 
-    return True
-
 
 # Hue anchor tooltips: explain what each band label means in perceptual OKLCH terms.
 # Shown as a Text_Knob separator inserted before the band sliders.
@@ -303,8 +458,31 @@ _HUE_BAND_TOOLTIP = (
     "  Magenta  ~ 325°"
 )
 
+# _ALL_LINK_DEFS resolved once into (kind, name, label, value) steps:
+#   "rule" → unnamed horizontal-rule divider
+#   "text" → named Text_Knob, value is its text (e.g. the hue band tooltip)
+#   "link" → Link_Knob, value is its link target
+_LINK_KNOB_PLAN = tuple(
+    ("link", name, label, target) if target is not None
+    else ("rule", "", "", "") if name == ""
+    else ("text", name, "", _HUE_BAND_TOOLTIP if name == "hue_bands_divider" else "")
+    for name, label, target in _ALL_LINK_DEFS
+)
+
 
-def _add_link_knobs(group_node: nuke.Node) -> None:
+def _make_divider():
+    """Return a horizontal-rule divider knob.
+
+    Text_Knob('', '') (empty name AND empty label) is what Nuke uses for its
+    own "Divider Line" control.  NO_RERENDER stops it from dirtying the node
+    hash.
+    """
+    div = nuke.Text_Knob("", "")
+    div.setFlag(_NO_RERENDER)
+    return div
+
+
+def _add_link_knobs(group_node: nuke.Node, existing: Optional[set] = None) -> List[str]:
     """Add Link_Knobs that directly reference internal node knobs.
 
     Must be called after _load_kernel_source so the BlinkScript kernel param
@@ -317,57 +495,65 @@ def _add_link_knobs(group_node: nuke.Node) -> None:
     Link_Knob is bidirectional, updates instantly at eval time with no Python
     overhead, and preserves the correct widget type (checkbox stays a checkbox,
     not an expression field).
+
+    ``existing`` is an optional knob-name snapshot (see _ensure_base_knobs).
+
+    Returns the names of knobs that could not be created; one failure does
+    not stop the rest of the panel from being built.
     """
+    # One knob-table snapshot; names are added as knobs are created.
+    if existing is None:
+        existing = set(group_node.knobs())
+
     # Fast re-entry guard — unnamed dividers can't be found by knob(), so we
     # use the first named knob as a proxy for the whole block.
-    if group_node.knob("input_colorspace") is not None:
-        return
-
-    all_defs = _COLORSPACE_LINK_DEFS + _GRADE_LINK_DEFS
+    if "input_colorspace" in existing:
+        return []
 
     # Add the tab only if it doesn't already exist.
     # Calling addKnob with a Tab_Knob whose name already exists creates a
     # *duplicate* tab rather than selecting the existing one, which produces
     # two "OKLCH Grade" tabs — one holding status_text and one holding the
     # link knobs added below.
-    if group_node.knob("OKLCHGrade") is None:
+    if "OKLCHGrade" not in existing:
         group_node.addKnob(nuke.Tab_Knob("OKLCHGrade", "OKLCH Grade"))
+        existing.add("OKLCHGrade")
 
-    for (name, label, target) in all_defs:
-        if target is None:
-            if name == "":
-                # True horizontal-rule divider: empty name AND empty label.
-                # Text_Knob('', '') is what Nuke uses for its own "Divider Line"
-                # control.  NO_RERENDER stops it from dirtying the node hash.
-                try:
-                    div = nuke.Text_Knob("", "")
-                    div.setFlag(_NO_RERENDER)
-                    group_node.addKnob(div)
-                except Exception:
-                    pass
-            else:
-                # Named content block (e.g. hue_bands_divider tooltip).
-                # Skip if already present.
-                if group_node.knob(name) is not None:
-                    continue
-                text_value = _HUE_BAND_TOOLTIP if name == "hue_bands_divider" else ""
+    skipped: List[str] = []
+    # Knob setup is not a user edit: one undo-free block for all addKnob calls.
+    with _undo_disabled():
+        for kind, name, label, value in _LINK_KNOB_PLAN:
+            if kind == "rule":
                 try:
-                    group_node.addKnob(nuke.Text_Knob(name, "", text_value))
+                    group_node.addKnob(_make_divider())
                 except Exception:
-                    pass
-        else:
-            # Named Link_Knob — skip if already present.
-            if group_node.knob(name) is not None:
+                    skipped.append("(divider)")
+                continue
+
+            # Named content block or Link_Knob — skip if already present.
+            if name in existing:
                 continue
             try:
-                lk = nuke.Link_Knob(name, label)
-                lk.setLink(target)
-                group_node.addKnob(lk)
+                if kind == "text":
+                    knob = nuke.Text_Knob(name, "", value)
+                else:
+                    knob = nuke.Link_Knob(name, label)
+                    knob.setLink(value)
+                group_node.addKnob(knob)
+                existing.add(name)
             except Exception:
-                pass
+                skipped.append(name)
+    return skipped
+
+
+# Internal OCIO bridge knobs pinned to the working space by _setup_working_space.
+_OCIO_BRIDGE_KNOBS = (
+    ("OCIOColorSpace_IN", "out_colorspace"),
+    ("OCIOColorSpace_OUT", "in_colorspace"),
+)
 
 
-def _setup_working_space(group_node: nuke.Node) -> None:
+def _setup_working_space(group_node: nuke.Node, skipped: Iterable[str] = ()) -> None:
     """Wire internal OCIO bridge to a fixed scene-linear working space.
 
     The public gizmo knobs remain linked to:
@@ -378,49 +564,74 @@ def _setup_working_space(group_node: nuke.Node) -> None:
     expressions:
     - OCIOColorSpace_IN.out_colorspace = scene_linear
     - OCIOColorSpace_OUT.in_colorspace = scene_linear
+
+    ``skipped`` lists link knobs _add_link_knobs failed to create; they are
+    reported in the status line.
     """
     fixed_space = "scene_linear"
-    ocio_in = group_node.node("OCIOColorSpace_IN")
-    ocio_out = group_node.node("OCIOColorSpace_OUT")
+    bridge = [_knob(group_node, "working_linear_srgb_space")]
+    for node_name, knob_name in _OCIO_BRIDGE_KNOBS:
+        child = group_node.node(node_name)
+        if child:
+            bridge.append(_knob(child, knob_name))
 
-    if ocio_in:
-        ocio_in["out_colorspace"].setValue(fixed_space)
-    if ocio_out:
-        ocio_out["in_colorspace"].setValue(fixed_space)
+    # Internal wiring is not a user edit: keep it off the undo stack.
+    # Knobs already at the working space are left alone (reopened scripts).
+    with _undo_disabled():
+        for k in bridge:
+            if k is not None and k.value() != fixed_space:
+                k.setValue(fixed_space)
+    status = f"Ready. Working space: {fixed_space}"
+    skipped = list(skipped)
+    if skipped:
+        status += f" ({len(skipped)} link knob(s) skipped: {', '.join(skipped[:3])})"
+    _set_text(group_node, "status_text", status)
 
-    wk = _knob(group_node, "working_linear_srgb_space")
-    if wk:
-        wk.setValue(fixed_space)
-    _set_text(group_node, "status_text", f"Ready. Working space: {fixed_space}")
 
 
+# Re-entrancy guard: the addKnob/setValue/recompile calls made during init
+# fire the group's knobChanged, whose retry path would otherwise re-enter
+# initialize_node while the panel is half built.
+_in_init = False
+
 
 def initialize_node(node: nuke.Node) -> None:
     """Called from gizmo onCreate: compile kernel, add Link_Knobs, wire OCIO."""
+    global _in_init
+    if _in_init:
+        return
+    _in_init = True
     try:
         # Guard: confirm we have the correct top-level group node.
         if not _is_oklch_group_node(node):
             return
 
-        _ensure_base_knobs(node)
-        _hide_tech_knobs(node)
-
         # Already initialized; keep this idempotent for repeated callbacks.
+        # Link knobs are only added after the base knobs, so nothing else
+        # needs creating once they exist.
         if _has_link_knobs(node):
+            _hide_tech_knobs(node)
             return
 
+        # One knob-name snapshot for both knob-creating steps.
+        existing = set(node.knobs())
+        _ensure_base_knobs(node, existing)
+        _hide_tech_knobs(node)
+
         # 1. Load and compile kernel
         if not _load_kernel_source(node):
             return
 
         # 2. Add Link_Knobs (param knobs now guaranteed to exist)
-        _add_link_knobs(node)
+        skipped = _add_link_knobs(node, existing)
 
         # 3. Wire OCIO working space
-        _setup_working_space(node)
+        _setup_working_space(node, skipped)
 
     except Exception as exc:
         _set_text(node, "status_text", f"Init error: {exc}")
+    finally:
+        _in_init = False
 
 
 def handle_knob_changed(node: nuke.Node, changed_knob) -> None:
@@ -431,7 +642,7 @@ def handle_knob_changed(node: nuke.Node, changed_knob) -> None:
     (nuke.thisNode() can return an internal child when the user is inside the
     group) and bail out silently.
     """
-    if changed_knob is None:
+    if changed_knob is None or _in_init:
         return
     if not _is_oklch_group_node(node):
         return